@@ -8,6 +8,7 @@
 # vim: set ts=4 sw=4 expandtab :
 
 import datetime
+import os
 import re
 
 try:
@@ -23,6 +24,10 @@ __version_tuple__ = (1, 0, 1)
 
 __all__ = ('FORMAT_HELP_MSG', 'text2datetime', 'applyFixedTimeComponent', 'applyRelativeTimeComponents', 'applyTimeWords', 'getDatetimeFromEuropeanTime', 'getDatetimeFromAmericanTime', 'getDatetimeFromDateStr')
 
+# Module-level references to the datetime members used while parsing, saving the attribute lookups on every call
+_datetime = datetime.datetime
+_timedelta = datetime.timedelta
+
 
 # Extensive help message describing the formats accepted.
 FORMAT_HELP_MSG = '''Date should be in one of the following forms:
@@ -46,6 +51,12 @@ FORMAT_HELP_MSG = '''Date should be in one of the following forms:
   You may use relative modifiers and have a final entry be a fixed time,
   for example "+3d 12:00:00" would be noon three days from now.
 
+  Year and month modifiers are added together into one total number of months, which is
+  applied once, before day, hour, minute, and second modifiers, in whichever order they are given.
+  The day is only clamped to the end of a shorter month after the total is applied.
+  For example, on Jan 31 "+1mo +1mo" is Mar 31 (same as "+2mo"), "+1mo -1mo" is Jan 31,
+  and on Jan 30 "+1d +1mo" is Mar 1.
+
 
  - *Fixed String*
   One of the following fixed strings:
@@ -92,8 +103,45 @@ NOTES:
 
 '''   
 
-# Regular expression for a single modification component, e.x. "+5d"
-DATE_MODIFIER_RE = re.compile('^(?P<dir>[\+\-])(?P<num>[\d]+)(?P<mod>(mo)|(yr)|([ydhms]{1}))$')
+# Regular expression for a single modification component, e.x. "+5d". Groups are ( direction, number, unit )
+#   applyRelativeTimeComponents uses the equivalent _parseModifier scanner instead.
+DATE_MODIFIER_RE = re.compile(r'^([+-])(\d+)(mo|yr|[ydhms])$')
+
+# Units accepted on a relative modifier (see DATE_MODIFIER_RE), to ( months, seconds ) per one of that unit.
+#   Months and years are calendar-aware and applied with relativedelta, the fixed-length units are applied with timedelta.
+_MODIFIER_UNITS = {
+    'y'  : (12, 0),
+    'yr' : (12, 0),
+    'mo' : (1, 0),
+    'd'  : (0, 86400),
+    'h'  : (0, 3600),
+    'm'  : (0, 60),
+    's'  : (0, 1),
+}
+
+# Pattern for ctime format with optional day of week, e.x. "Wed Jan 28 12:28:13 2015"
+_CTIME_PATTERN = r'(?:(?P<ctimeDayOfWeek>[A-Za-z]{3}) )?(?P<ctimeMonth>[A-Za-z]{3}) (?P<ctimeDay>\d{1,2}) (?P<ctimeHours>\d{1,2}):(?P<ctimeMinutes>\d{1,2}):(?P<ctimeSeconds>\d{1,2}) (?P<ctimeYear>\d{4})'
+
+# Pattern for a slash-separated date with optional time, e.x. "1/28/2015" or "1/28/2015 12:28:13PM"
+_DATE_PATTERN = r'(?P<dateFirst>\d{1,2})/(?P<dateSecond>\d{1,2})/(?P<dateYear>\d{4}|\d{2})(?: (?P<dateHours>\d{1,2}):(?P<dateMinutes>\d{1,2})(?::(?P<dateSeconds>\d{1,2}))?(?: ?(?P<dateAmPm>[AaPp][Mm]))?)?'
+
+# Regular expression matching any absolute (ctime or date) string in a single pass. Only the groups of the matching format are set.
+_ABSOLUTE_RE = re.compile('^(?:' + _CTIME_PATTERN + '|' + _DATE_PATTERN + ')$')
+
+# Regular expression matching only a slash-separated date, used by getDatetimeFromDateStr
+_DATE_RE = re.compile('^' + _DATE_PATTERN + '$')
+
+# Lowercase 3-letter month abbreviations to month number, as used in ctime format
+_MONTH_NUMBERS = { 'jan' : 1, 'feb' : 2, 'mar' : 3, 'apr' : 4, 'may' : 5, 'jun' : 6, 'jul' : 7, 'aug' : 8, 'sep' : 9, 'oct' : 10, 'nov' : 11, 'dec' : 12 }
+
+# Lowercase 3-letter day of week abbreviations, as used in ctime format
+_DAYS_OF_WEEK = frozenset( ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun') )
+
+# Time words (other than "now") to the offset in days from the origin date. These represent the beginning of that day.
+_TIME_WORD_DAY_OFFSETS = { 'today' : 0, 'tomorrow' : 1, 'yesterday' : -1 }
+
+# First character, in either case, of every time word ("now" and those in _TIME_WORD_DAY_OFFSETS)
+_TIME_WORD_FIRST_CHARS = frozenset('ntyNTY')
 
 # Message contained within ValueError for general parsing failures.
 UNKNOWN_TIME_MSG = 'Cannot parse time: "%s". ' + FORMAT_HELP_MSG
@@ -101,6 +149,26 @@ UNKNOWN_TIME_MSG = 'Cannot parse time: "%s". ' + FORMAT_HELP_MSG
 # Error message for invalid format on a fixed time component.
 FIXED_TIME_ERROR_STR = 'Fixed time component %s must be numerical hours:minutes:seconds or hours:minutes (e.x. 12:38)'
 
+# Maximum number of parsed absolute (ctime or date) strings to remember. The cache is emptied once it reaches this size.
+#   Can be set with the TEXT2DATETIME_CACHE_SIZE environment variable, 0 disables the cache.
+try:
+    ABSOLUTE_CACHE_MAX_SIZE = int(os.environ.get('TEXT2DATETIME_CACHE_SIZE', 4096))
+except ValueError:
+    ABSOLUTE_CACHE_MAX_SIZE = 4096
+
+# Results of previously parsed absolute strings, keyed on (timeStr, monthBeforeDay is True) for text2datetime,
+#   or ('date', timeStr, monthBeforeDay is True) for getDatetimeFromDateStr
+_absoluteCache = {}
+
+# Each distinct datetime held by _absoluteCache, mapped to itself. Never larger than _absoluteCache.
+_internedDatetimes = {}
+
+# Maximum number of distinct month totals to keep a relativedelta for, see _getMonthDelta
+_MONTH_DELTAS_MAX_SIZE = 256
+
+# Month total to a shared relativedelta of that many months
+_monthDeltas = {}
+
 
 #################################
 ####      PUBLIC METHODS    #####
@@ -122,53 +190,33 @@ def text2datetime(timeStr, now=None, monthBeforeDay=True):
         @return <datetime.datetime> - Datetime object representing parsed time.
     ''' # %(FORMAT_HELP_MSG,)
 
-    if now is None:
-        now = datetime.datetime.now()
-    elif not issubclass(now.__class__, datetime.datetime):
+    if now is not None and not issubclass(now.__class__, _datetime):
         raise ValueError('Argument "now" must be a datetime.datetime object, or None to use current date and time. Got: type=%s: %s' %(str(type(now)), repr(now)))
 
     timeStr = timeStr.strip()
 
+    # ctime or date string, which do not depend on "now". These never start with a time word or contain a relative modifier,
+    #   so they are checked first, and the current time is only fetched for the remaining formats.
+    absoluteResult = _parseAbsolute(timeStr, monthBeforeDay)
+    if absoluteResult is not None:
+        return absoluteResult
+
+    if now is None:
+        now = datetime.datetime.now()
+
     # Time Words 
     timeWordResult = applyTimeWords(now, timeStr)
     if timeWordResult is not None:
         return timeWordResult
 
-    timeStr = _condenseAmPm(timeStr)
-
-    # Relative Date Modifiers
-    if '+' in timeStr or '-' in timeStr: 
+    # Relative Date Modifiers, which always start with a direction
+    if timeStr[:1] in ('+', '-'):
         return applyRelativeTimeComponents(now, timeStr)
 
-    # One of the remaining fixed string formats
-    numSpaces = timeStr.count(' ')
-
-    # If 4 spaces, try ctime including day of week
-    if numSpaces == 4: 
-        try:
-            return datetime.datetime.strptime(timeStr, "%a %b %d %H:%M:%S %Y")
-        except:
-            raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
-    # If 3 spaces, try ctime without day of week
-    elif numSpaces == 3:
-        try:
-            return datetime.datetime.strptime(timeStr, "%b %d %H:%M:%S %Y")
-        except:
-            raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
-
-    # American/European Date (mo/day/yr) or (day/mo/yr) with [optional time]
-    elif timeStr.count('/') == 2:
-        try:
-            return getDatetimeFromDateStr(timeStr, monthBeforeDay)
-        except ValueError:
-            raise
-    elif ':' in timeStr:
-        # Just a plain time, modify today's date with that time
-        try:
-            return applyFixedTimeComponent(now, timeStr)
-        except:
-            raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
-    else:
+    # Just a plain time, modify today's date with that time. applyFixedTimeComponent rejects anything without a ':' itself.
+    try:
+        return applyFixedTimeComponent(now, timeStr)
+    except ValueError:
         raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
 
 
@@ -187,45 +235,43 @@ def applyRelativeTimeComponents(datetimeObj, timeStr):
 
         @return <datetime.datetime> - A datetime object representing the date and time derived after applying all the relative components to the provided datetime.
     '''
-    components = [x for x in timeStr.split(' ') if x]
-    
-    # Functions used to add/sub to date with relative time deltas
-    componentAdd = lambda dateObj, rdelta : dateObj + rdelta
-    componentSub = lambda dateObj, rdelta : dateObj - rdelta
-
-    numComponents = len(components)
-    for i in range(numComponents):
-        component = components[i]
-
-        matchObj = DATE_MODIFIER_RE.match(component)
-        if matchObj is None:
-            # If on final item, it may be a time modifier
-            if i + 1 == numComponents and ':' in component:
-                datetimeObj = applyFixedTimeComponent(datetimeObj, component)
-                continue
-            else:
-                raise ValueError('Could not parse time modifier component: %s. It should be in the format +## followed by (yr=years, mo=months, d=days, h=hours, m=minutes, s=seconds). Example: +5d = 5 days, +2mo = 2 months.' %(component,))
+    components = timeStr.split()
 
-        # Matched, now apply modifier
-        groupDict = matchObj.groupdict()
-        (direction, num, mod) = (groupDict['dir'], groupDict['num'], groupDict['mod'])
-        if direction == '+':
-            doComponent = componentAdd
-        else:
-            doComponent = componentSub
-            
-        if mod == 'd':
-            datetimeObj = doComponent(datetimeObj, relativedelta(days=int(num)))
-        elif mod == 'mo':
-            datetimeObj = doComponent(datetimeObj, relativedelta(months=int(num)))
-        elif mod == 'm':
-            datetimeObj = doComponent(datetimeObj, relativedelta(minutes=int(num)))
-        elif mod == 'h':
-            datetimeObj = doComponent(datetimeObj, relativedelta(hours=int(num)))
-        elif mod in ('y', 'yr'):
-            datetimeObj = doComponent(datetimeObj, relativedelta(months=int(num)*12))
-        elif mod == 's':
-            datetimeObj = doComponent(datetimeObj, relativedelta(seconds=int(num)))
+    # A final fixed time may be followed by a separate "AM" or "PM"
+    if len(components) > 1 and components[-1].lower() in ('am', 'pm'):
+        components[-2:] = [components[-2] + components[-1]]
+
+    # The final item may be a fixed time. A modifier never contains ':', so it is taken off before the loop.
+    if components and ':' in components[-1]:
+        fixedTimeComponent = components.pop()
+    else:
+        fixedTimeComponent = None
+
+    # All modifiers are totalled and applied at once, as a single month delta followed by a single fixed-length delta
+    totalMonths = 0
+    totalSeconds = 0
+
+    for component in components:
+        modifier = _parseModifier(component)
+        if modifier is None:
+            raise ValueError('Could not parse time modifier component: %s. It should be in the format +## followed by (yr=years, mo=months, d=days, h=hours, m=minutes, s=seconds). Example: +5d = 5 days, +2mo = 2 months.' %(component,))
+
+        # Matched, now total modifier. Direction is applied as the sign.
+        (direction, num, mod) = modifier
+        if direction == '-':
+            num = -num
+
+        (monthsPerUnit, secondsPerUnit) = _MODIFIER_UNITS[mod]
+        totalMonths += num * monthsPerUnit
+        totalSeconds += num * secondsPerUnit
+
+    if totalMonths:
+        datetimeObj = datetimeObj + _getMonthDelta(totalMonths)
+    if totalSeconds:
+        datetimeObj = datetimeObj + _timedelta(seconds=totalSeconds)
+
+    if fixedTimeComponent is not None:
+        datetimeObj = applyFixedTimeComponent(datetimeObj, fixedTimeComponent)
 
     # Return our completed date
     return datetimeObj
@@ -244,26 +290,29 @@ def applyFixedTimeComponent(datetimeObj, fixedTimeStr):
 
         @return <datetime.datetime> - datetimeObj with time replaced.
     '''
-    if fixedTimeStr.count(':') not in (1, 2):
-        raise ValueError(FIXED_TIME_ERROR_STR %(fixedTimeStr,))
-
+    # The component count is checked after the AM/PM suffix is stripped, but the error names the string as given
+    origFixedTimeStr = fixedTimeStr
     (fixedTimeStr, hoursMod) = _stripAmPm(fixedTimeStr)
 
+    # The split both validates the number of components and extracts them, in a single pass over the string
     fixedTimeSplit = fixedTimeStr.split(':')
+    numComponents = len(fixedTimeSplit)
 
-    hours = fixedTimeSplit[0]
-    minutes = fixedTimeSplit[1]
-    if len(fixedTimeSplit) > 2:
-        seconds = fixedTimeSplit[2]
-    else:
+    if numComponents == 2:
+        (hours, minutes) = fixedTimeSplit
         seconds = '0'
+    elif numComponents == 3:
+        (hours, minutes, seconds) = fixedTimeSplit
+    else:
+        raise ValueError(FIXED_TIME_ERROR_STR %(origFixedTimeStr,))
 
-    if not hours.isdigit() or not minutes.isdigit() or not seconds.isdigit():
+    # Check all components with a single scan. Empty components must be rejected separately, as they vanish when joined.
+    if not (hours and minutes and seconds and (hours + minutes + seconds).isdigit()):
         raise ValueError(FIXED_TIME_ERROR_STR %(fixedTimeStr,))
 
     hours = hoursMod(int(hours))
     
-    return datetime.datetime(year=datetimeObj.year, month=datetimeObj.month, day=datetimeObj.day, hour=hours, minute=int(minutes), second=int(seconds))
+    return datetimeObj.replace(hour=hours, minute=int(minutes), second=int(seconds), microsecond=0)
 
 
 def applyTimeWords(datetimeObj, timeStr):
@@ -281,31 +330,31 @@ def applyTimeWords(datetimeObj, timeStr):
 
         @return - <datetime.datetime/None> - The transformed datetime.datetime object if a valid word was given, otherwise None if there was no match.
     '''
-    timeStrLower = timeStr.lower()
-    items = timeStrLower.strip().split(' ', 1)
-    ret = None
+    timeStr = timeStr.strip()
 
-    firstItem = items[0]
+    # Every time word starts with one of these, so other strings are rejected without splitting or lowering
+    if timeStr[:1] not in _TIME_WORD_FIRST_CHARS:
+        return None
+
+    items = timeStr.split(' ', 1)
+
+    # Only the word itself needs lowering, any following time is case insensitive already
+    firstItem = items[0].lower()
 
     if firstItem == 'now':
-        ret = datetimeObj
         if len(items) > 1:
             raise ValueError('Using "now" does not make sense with other modifiers.')
-    elif firstItem == 'today':
-        ret = datetime.datetime(year=datetimeObj.year, month=datetimeObj.month, day=datetimeObj.day, hour=0, minute=0, second=0)
-    elif firstItem == 'tomorrow':
-        tomorrow = datetimeObj + relativedelta(days=1)
-        ret = datetime.datetime(year=tomorrow.year, month=tomorrow.month, day=tomorrow.day, hour=0, minute=0, second=0)
-    elif firstItem == 'yesterday':
-        yesterday = datetimeObj - relativedelta(days=1)
-        ret = datetime.datetime(year=yesterday.year, month=yesterday.month, day=yesterday.day, hour=0, minute=0, second=0)
+        return datetimeObj
 
-    if ret is not None:
-        if len(items) > 1:
-            ret = applyFixedTimeComponent(ret, items[1])
-        return ret
+    dayOffset = _TIME_WORD_DAY_OFFSETS.get(firstItem)
+    if dayOffset is None:
+        return None
 
-    return None
+    ret = (datetimeObj + _timedelta(days=dayOffset)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if len(items) > 1:
+        ret = applyFixedTimeComponent(ret, items[1])
+    return ret
 
 
 def getDatetimeFromAmericanTime(timeStr):
@@ -353,79 +402,197 @@ def getDatetimeFromDateStr(timeStr, monthBeforeDay):
 
         @return <datetime.datetime> - A datetime object representing the converted time.
     '''
-    timeStr = _condenseAmPm(timeStr)
+    # Kept apart from text2datetime's entries for the same string, which may be ctime results. As in _parseAbsolute,
+    #   key on the monthBeforeDay value parsing uses.
+    cacheKey = ('date', timeStr, monthBeforeDay is True)
+    ret = _absoluteCache.get(cacheKey)
+    if ret is not None:
+        return ret
+
+    matchObj = _DATE_RE.match(timeStr)
+    if matchObj is None:
+        raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
 
+    return _cacheAbsolute(cacheKey, _getDatetimeFromDateFields(timeStr, matchObj.groups(), monthBeforeDay))
 
-    numSpaces = timeStr.count(' ')
 
-    if numSpaces >= 2:
-        # We may have a " AM" or " PM", so condense it and see if we can get a valid time format
-        timeStr = _condenseAmPm(timeStr)
-        if numSpaces >= 2:
-            raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
 
-    if monthBeforeDay is True:
-        dateFormat = "%m/%d"
+#################################
+####     INTERNAL METHODS   #####
+#################################
+
+
+def _parseModifier(component):
+    '''
+        _parseModifier - Parse a single relative modification component, e.x. "+5d". Accepts the same components as DATE_MODIFIER_RE, without the regex engine.
+
+        @param component <str> - A single whitespace-free component
+
+        @return tuple<str, int, str>/None - ( direction, number, unit ), or None if component is not a valid modifier.
+    '''
+    direction = component[:1]
+    if direction not in ('+', '-'):
+        return None
+
+    # Units are one or two letters, so the two-letter units ("mo", "yr") are tried first
+    unit = component[-2:]
+    if unit not in _MODIFIER_UNITS:
+        unit = component[-1:]
+        if unit not in _MODIFIER_UNITS:
+            return None
+
+    # Everything between the direction and the unit must be digits. Like \d, isdigit() accepts non-ASCII decimal digits,
+    #   but it also accepts a few digits (e.x. superscripts) which \d and int() do not, so those are rejected by int() here.
+    num = component[1:len(component) - len(unit)]
+    if not num.isdigit():
+        return None
+
+    try:
+        return (direction, int(num), unit)
+    except ValueError:
+        return None
+
+
+def _getMonthDelta(months):
+    '''
+        _getMonthDelta - Get a relativedelta of the given number of months. Instances are shared between calls,
+          which is safe as they are only ever added to datetimes and never modified.
+
+        @param months <int> - Number of months, may be negative
+
+        @return <relativedelta> - relativedelta(months=months)
+    '''
+    monthDelta = _monthDeltas.get(months)
+    if monthDelta is None:
+        if len(_monthDeltas) >= _MONTH_DELTAS_MAX_SIZE:
+            _monthDeltas.clear()
+        monthDelta = _monthDeltas[months] = relativedelta(months=months)
+
+    return monthDelta
+
+
+def _parseAbsolute(timeStr, monthBeforeDay):
+    '''
+        _parseAbsolute - Parse a ctime or date (month/day/year or day/month/year) string. These do not depend on the current time,
+          so results are remembered in _absoluteCache and repeated strings are not parsed again.
+
+        @param timeStr <str> - A stripped time string
+        @param monthBeforeDay <bool> - If True, date will be assumed month/day/year. If False, date will be assumed day/month/year.
+
+        @return <datetime.datetime/None> - The parsed datetime, or None if timeStr is not a ctime or date string.
+    '''
+    # Parsing only treats monthBeforeDay as month-first when it is exactly True, so key on that rather than the raw (possibly 1 == True) value
+    cacheKey = (timeStr, monthBeforeDay is True)
+    ret = _absoluteCache.get(cacheKey)
+    if ret is not None:
+        return ret
+
+    matchObj = _ABSOLUTE_RE.match(timeStr)
+    if matchObj is None:
+        return None
+
+    fields = matchObj.groups()
+
+    # ctime is the only format which ends with its year group
+    if matchObj.lastgroup == 'ctimeYear':
+        ret = _getDatetimeFromCtimeFields(timeStr, fields[:7])
+    # American/European Date (mo/day/yr) or (day/mo/yr) with [optional time]
     else:
-        dateFormat = "%d/%m"
+        ret = _getDatetimeFromDateFields(timeStr, fields[7:], monthBeforeDay)
 
-    # If has space, includes time.
-    if numSpaces == 1:
-        if len(timeStr.split(' ')[0].split('/')[-1]) == 4:
-            yearFormat = 'Y'
-        else:
-            yearFormat = 'y'
+    return _cacheAbsolute(cacheKey, ret)
 
-        colonCount = timeStr.count(':')
-        if colonCount == 2:
-            timeFormat = '%H:%M:%S'
-        elif colonCount == 1:
-            timeFormat = '%H:%M'
-        else:
-            raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
-
-        if timeStr[-2:].upper() in ('AM', 'PM'):
-            timeFormat += '%p'
-
-        try:
-            return datetime.datetime.strptime(timeStr, dateFormat + '/%' + yearFormat + ' ' + timeFormat)
-        except:
-            raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
-    # No space, assume time as 00:00:00
-    else: 
-        if len(timeStr.split('/')[-1]) == 4:
-            yearFormat = 'Y'
-        else:
-            yearFormat = 'y'
-        try:
-            return datetime.datetime.strptime(timeStr + ' 00:00:00', dateFormat + '/%' + yearFormat + ' %H:%M:%S')
-        except:
-            raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
 
+def _cacheAbsolute(cacheKey, ret):
+    '''
+        _cacheAbsolute - Remember the result of parsing an absolute string in _absoluteCache.
+          datetime objects are immutable, so the same result can safely be handed out again.
 
+        @param cacheKey <tuple> - Key to store under
+        @param ret <datetime.datetime> - The parsed result
 
-#################################
-####     INTERNAL METHODS   #####
-#################################
+        @return <datetime.datetime> - The interned result, equal to ret. Use this in place of ret.
+    '''
+    if ABSOLUTE_CACHE_MAX_SIZE <= 0:
+        return ret
+
+    if len(_absoluteCache) >= ABSOLUTE_CACHE_MAX_SIZE:
+        _absoluteCache.clear()
+        _internedDatetimes.clear()
 
+    # Different strings for the same time (e.x. "1/28/2015" and "01/28/2015") share one object
+    ret = _internedDatetimes.setdefault(ret, ret)
+    _absoluteCache[cacheKey] = ret
 
-def _condenseAmPm(timeStr):
+    return ret
+
+
+def _getDatetimeFromCtimeFields(timeStr, ctimeFields):
+    '''
+        _getDatetimeFromCtimeFields - Convert the fields matched from a ctime format string to a datetime object.
+
+        @param timeStr <str> - The matched string, used in error messages
+        @param ctimeFields tuple<str/None> - ( day of week or None, month, day, hours, minutes, seconds, year )
+
+        @return <datetime.datetime> - A datetime object representing the converted time.
+    '''
+    (dayOfWeek, month, day, hours, minutes, seconds, year) = ctimeFields
+
+    if dayOfWeek is not None and dayOfWeek.lower() not in _DAYS_OF_WEEK:
+        raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
+
+    month = _MONTH_NUMBERS.get(month.lower())
+    if month is None:
+        raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
+
+    try:
+        return _datetime(int(year), month, int(day), int(hours), int(minutes), int(seconds))
+    except ValueError:
+        raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
+
+
+def _getDatetimeFromDateFields(timeStr, dateFields, monthBeforeDay):
     '''
-        _condenseAmPm - If there is a trailing space between the time and AM/PM, remove that space.
+        _getDatetimeFromDateFields - Convert the fields matched from a slash-separated date string to a datetime object.
 
-        @param timeStr <str> - A string representing a time
+        @param timeStr <str> - The matched string, used in error messages
+        @param dateFields tuple<str/None> - ( first date part, second date part, year, hours, minutes, seconds, AM/PM ). Time fields are None when not given.
+        @param monthBeforeDay <bool> - If True, date will be assumed month/day/year. If False, date will be assumed day/month/year.
 
-        @return <str> - The time string without the trailing whitespace between the time and "AM"/"PM"
+        @return <datetime.datetime> - A datetime object representing the converted time.
     '''
-    if len(timeStr) < 3:
-        return timeStr
+    (first, second, year, hours, minutes, seconds, amPm) = dateFields
 
-    lastThree = timeStr[-3:].upper()
+    if monthBeforeDay is True:
+        (month, day) = (first, second)
+    else:
+        (month, day) = (second, first)
 
-    if lastThree in (' AM', ' PM'):
-        return timeStr[:-3] + timeStr[-2:]
+    # Two-digit years follow strptime's %y, 69-99 are 1900s and 00-68 are 2000s
+    if len(year) == 2:
+        year = int(year)
+        if year <= 68:
+            year += 2000
+        else:
+            year += 1900
+    else:
+        year = int(year)
 
-    return timeStr
+    try:
+        # No time given, assume 00:00:00
+        if hours is None:
+            return _datetime(year, int(month), int(day))
+
+        hours = int(hours)
+        if amPm is not None:
+            if amPm[0] in ('a', 'A'):
+                hours = _convertAmTo24Hour(hours)
+            else:
+                hours = _convertPmTo24Hour(hours)
+
+        return _datetime(year, int(month), int(day), hours, int(minutes), int(seconds or 0))
+    except ValueError:
+        raise ValueError(UNKNOWN_TIME_MSG % (timeStr,))
 
 
 def _convertAmTo24Hour(hours):
@@ -434,9 +601,8 @@ def _convertAmTo24Hour(hours):
     '''
     if hours > 12:
         raise ValueError('Hours must be <= 12 when using "AM" or "PM". Got: %s' %(str(hours),))
-    elif hours == 12:
-        return 0
-    return hours
+    # 12AM is midnight
+    return hours % 12
 
 def _convertPmTo24Hour(hours):
     '''
@@ -444,26 +610,28 @@ def _convertPmTo24Hour(hours):
     '''
     if hours > 12:
         raise ValueError('Hours must be <= 12 when using "AM" or "PM". Got: %s' %(str(hours),))
-    elif hours == 12:
-        return 12
-    return hours + 12
+    # 12PM is noon
+    return (hours % 12) + 12
+
+def _identity(hours):
+    '''
+        _identity - Function for times without AM or PM, hours are already 24-hour
+    '''
+    return hours
 
 def _stripAmPm(timeStr):
     '''
-        _stripAmPm - Strips "AM" or "PM" with optional leading space off the end, and returns an associated function to modify hours
+        _stripAmPm - Strips "AM" or "PM" with optional leading whitespace off the end, and returns an associated function to modify hours
 
         @return tuple ( stripped time str, hours function )
     '''
-        
-    if timeStr[-1] in ('m', 'M') and len(timeStr) >= 2:
-        condensed = _condenseAmPm(timeStr)
-        otherChar = timeStr[-2].upper()
+    suffix = timeStr[-2:].lower()
 
-        if otherChar == 'A':
-            return ( condensed[:-2], _convertAmTo24Hour)
-        elif otherChar == 'P':
-            return ( condensed[:-2], _convertPmTo24Hour)
+    if suffix == 'am':
+        return ( timeStr[:-2].rstrip(), _convertAmTo24Hour)
+    elif suffix == 'pm':
+        return ( timeStr[:-2].rstrip(), _convertPmTo24Hour)
 
-    return (timeStr, lambda hours : hours)
+    return (timeStr, _identity)
 
 